@@ -6,9 +6,10 @@ This Streamlit app visualizes trends in cybercrime complaints for U.S. states
 across the years 2021–2024.  It includes the same functionality as the
 original dashboard but packages the required data directly in the code.
 
-If a ``cybercrime_top10.csv`` file is present in the same directory, the
-application will load that CSV.  Otherwise, it falls back to a built‑in
-dataset derived from the Insurance Information Institute’s table of top
+Data is read from ``cybercrime_top10.parquet`` in the same directory when
+that file is at least as new as any ``cybercrime_top10.csv`` beside it;
+otherwise a ``cybercrime_top10.csv`` there is loaded.  Failing both, the
+application falls back to a built‑in dataset derived from the Insurance Information Institute’s table of top
 states by number of cybercrime complaints and by losses for 2024【264901952604557†L84-L100】.  For states not appearing in the
 top‑ten list, complaint counts are set to zero and loss figures are left
 missing.  The built‑in dataset also estimates complaint counts for prior
@@ -22,6 +23,8 @@ import altair as alt
 import numpy as np
 import os
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import streamlit as st
 
 # Try to import Plotly; fall back gracefully if it's missing
@@ -31,6 +34,69 @@ try:
 except Exception:
     PLOTLY_AVAILABLE = False
 
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+# Columns of the top‑ten dataset used by the dashboard
+_DATA_COLUMNS = (
+    "state",
+    "state_code",
+    "complaints_2024",
+    "complaints_2023",
+    "complaints_2022",
+    "complaints_2021",
+    "losses_2024_million",
+)
+
+# Compact dtypes for the numeric columns: complaint counts (at most ~1e5
+# per state) fit comfortably in int32 and losses need no float64 precision
+_DATA_DTYPES = {
+    "complaints_2024": "int32",
+    "complaints_2023": "int32",
+    "complaints_2022": "int32",
+    "complaints_2021": "int32",
+    "losses_2024_million": "float32",
+}
+# The same column types for PyArrow's CSV reader
+_ARROW_TYPES = {col: pa.from_numpy_dtype(np.dtype(dtype)) for col, dtype in _DATA_DTYPES.items()}
+
+# Years covered by the dataset (most recent first) and the complaint column
+# holding each one; the map saves parsing years out of column names
+_YEARS = (2024, 2023, 2022, 2021)
+_YEAR_MAP = {f"complaints_{year}": year for year in _YEARS}
+
+# Colour palettes (highlight, background) for each donut chart scheme
+_DONUT_PALETTES: dict[str, tuple[str, str]] = {
+    "blue": ("#29b5e8", "#155F7A"),
+    "green": ("#27AE60", "#12783D"),
+    "orange": ("#F39C12", "#875A12"),
+    "red": ("#E74C3C", "#781F16"),
+}
+
+# All U.S. states (plus D.C.) and their postal abbreviations
+_US_STATE_NAMES = (
+    "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
+    "Connecticut", "Delaware", "District of Columbia", "Florida", "Georgia",
+    "Hawaii", "Idaho", "Illinois", "Indiana", "Iowa", "Kansas", "Kentucky",
+    "Louisiana", "Maine", "Maryland", "Massachusetts", "Michigan", "Minnesota",
+    "Mississippi", "Missouri", "Montana", "Nebraska", "Nevada",
+    "New Hampshire", "New Jersey", "New Mexico", "New York", "North Carolina",
+    "North Dakota", "Ohio", "Oklahoma", "Oregon", "Pennsylvania",
+    "Rhode Island", "South Carolina", "South Dakota", "Tennessee", "Texas",
+    "Utah", "Vermont", "Virginia", "Washington", "West Virginia", "Wisconsin",
+    "Wyoming",
+)
+_US_STATE_CODES = (
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "DC", "FL", "GA", "HI",
+    "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN",
+    "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH",
+    "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA",
+    "WV", "WI", "WY",
+)
+# Built once at import so ``build_full_data`` is a pure merge
+_US_STATES_DF = pd.DataFrame({"state": _US_STATE_NAMES, "state_code": _US_STATE_CODES})
+
 # -----------------------------------------------------------------------------
 # Utility functions
 # -----------------------------------------------------------------------------
@@ -43,10 +109,16 @@ def format_number(num: float) -> str:
     between one thousand and one million use a ``K`` suffix.  Smaller
     integers are returned unchanged.
     """
-    try:
+    # Fast path for the numeric (usually NumPy) values used by the metrics
+    if isinstance(num, (int, np.integer)):
+        n = num
+    elif isinstance(num, (float, np.floating)):
         n = float(num)
-    except (ValueError, TypeError):
-        return str(num)
+    else:
+        try:
+            n = float(num)
+        except (ValueError, TypeError):
+            return str(num)
     if n >= 1_000_000:
         return f"{n / 1_000_000:.1f} M"
     if n >= 1_000:
@@ -54,7 +126,25 @@ def format_number(num: float) -> str:
     return f"{int(n):,}"
 
 
-def make_donut(percent: float, label: str, colour: str) -> alt.Chart:
+def format_number_array(values) -> np.ndarray:
+    """Vectorised counterpart of :func:`format_number` for whole columns.
+
+    ``values`` is any array‑like of non‑negative numbers.  The ``M``/``K``/
+    plain forms are produced with NumPy string operations and selected per
+    element with ``np.select``, so no Python function is called per cell.
+    """
+    n = np.asarray(values, dtype=np.float64)
+    return np.select(
+        [n >= 1_000_000, n >= 1_000],
+        [
+            np.char.add(np.char.mod("%.1f", n / 1_000_000), " M"),
+            np.char.add(np.char.mod("%.1f", n / 1_000), " K"),
+        ],
+        default=np.char.mod("%d", n),
+    )
+
+
+def make_donut(percent: float, label: str, colour: str) -> dict:
     """Create a simple donut chart showing a percentage.
 
     ``percent`` should be between 0 and 100.  ``label`` is the label for
@@ -62,80 +152,196 @@ def make_donut(percent: float, label: str, colour: str) -> alt.Chart:
     predefined colour schemes: ``'blue'``, ``'green'``, ``'orange'`` or
     ``'red'``.  The colour pairs were chosen to contrast against the dark
     Altair theme used throughout the dashboard.
+
+    The chart is returned as a Vega‑Lite spec written out by hand (a
+    background ring, the highlighted ring and the central text layered over
+    two inline datasets), so no Altair objects are built or validated.
     """
-    # Define colour palettes for each scheme
-    palette = {
-        "blue": ["#29b5e8", "#155F7A"],
-        "green": ["#27AE60", "#12783D"],
-        "orange": ["#F39C12", "#875A12"],
-        "red": ["#E74C3C", "#781F16"],
-    }.get(colour, ["#29b5e8", "#155F7A"])
-
-    # Data for the foreground and background arcs
-    source = pd.DataFrame({"topic": [label, ""], "value": [percent, 100 - percent]})
-    source_bg = pd.DataFrame({"topic": [label, ""], "value": [100, 0]})
-
-    # Background ring (full 100 %)
-    plot_bg = (
-        alt.Chart(source_bg)
-        .mark_arc(innerRadius=45, cornerRadius=20)
-        .encode(
-            theta="value",
-            color=alt.Color(
-                "topic:N",
-                scale=alt.Scale(domain=[label, ""], range=palette),
-                legend=None,
-            ),
-        )
-        .properties(width=130, height=130)
-    )
+    palette = _DONUT_PALETTES.get(colour, _DONUT_PALETTES["blue"])
+
+    # Encodings shared by every layer
+    encoding = {
+        "theta": {"field": "value", "type": "quantitative"},
+        "color": {
+            "field": "topic",
+            "type": "nominal",
+            "scale": {"domain": [label, ""], "range": palette},
+            "legend": None,
+        },
+    }
+    return {
+        "usermeta": {"embedOptions": {"theme": "dark"}},
+        "width": 130,
+        "height": 130,
+        # Data for the background (full 100 %) and foreground arcs
+        "datasets": {
+            "background": [{"topic": label, "value": 100}, {"topic": "", "value": 0}],
+            "foreground": [
+                {"topic": label, "value": percent},
+                {"topic": "", "value": 100 - percent},
+            ],
+        },
+        "layer": [
+            # Background ring
+            {
+                "data": {"name": "background"},
+                "mark": {"type": "arc", "innerRadius": 45, "cornerRadius": 20},
+                "encoding": encoding,
+            },
+            # Foreground ring (highlighted portion)
+            {
+                "data": {"name": "foreground"},
+                "mark": {"type": "arc", "innerRadius": 45, "cornerRadius": 25},
+                "encoding": encoding,
+            },
+            # Central text showing the percentage
+            {
+                "data": {"name": "foreground"},
+                "mark": {
+                    "type": "text",
+                    "align": "center",
+                    "color": palette[0],
+                    "fontSize": 32,
+                    "fontWeight": 700,
+                    "fontStyle": "italic",
+                },
+                "encoding": {**encoding, "text": {"value": f"{int(round(percent))} %"}},
+            },
+        ],
+    }
+
 
-    # Foreground ring (highlighted portion)
-    plot_fg = (
-        alt.Chart(source)
-        .mark_arc(innerRadius=45, cornerRadius=25)
+def make_heatmap(heatmap_df: pd.DataFrame, theme: str) -> alt.Chart:
+    """Create the state × year heatmap of complaint counts.
+
+    ``heatmap_df`` is the long‑form output of :func:`prepare_heatmap_data`
+    and ``theme`` is the Vega colour scheme used for the cells.  States are
+    ordered by total complaints, computed here once so that Vega only has
+    to apply a fixed order rather than aggregate the data in the browser.
+    """
+    state_order = (
+        heatmap_df.groupby("state", observed=True)["complaints"]
+        .sum()
+        .sort_values(ascending=False, kind="stable")
+        .index.tolist()
+    )
+    return (
+        alt.Chart(heatmap_df)
+        .mark_rect()
         .encode(
-            theta="value",
+            y=alt.Y(
+                "year:O",
+                axis=alt.Axis(
+                    title="Year",
+                    titleFontSize=16,
+                    titleFontWeight=600,
+                    labelAngle=0,
+                ),
+            ),
+            x=alt.X(
+                "state:O",
+                sort=state_order,
+                axis=alt.Axis(title="State", titleFontSize=16, titleFontWeight=600),
+            ),
             color=alt.Color(
-                "topic:N",
-                scale=alt.Scale(domain=[label, ""], range=palette),
-                legend=None,
+                "complaints:Q",
+                scale=alt.Scale(scheme=theme),
+                legend=alt.Legend(title="Complaints"),
             ),
+            stroke=alt.value("black"),
+            strokeWidth=alt.value(0.25),
         )
-        .properties(width=130, height=130)
+        .properties(width=900, height=300)
+        .configure_axis(labelFontSize=10, titleFontSize=12)
     )
 
-    # Central text showing the percentage
-    text = (
-        plot_fg
-        .mark_text(
-            align="center",
-            color=palette[0],
-            fontSize=32,
-            fontWeight=700,
-            fontStyle="italic",
-        )
-        .encode(text=alt.value(f"{int(round(percent))} %"))
+
+@st.cache_data
+def heatmap_spec(heatmap_df: pd.DataFrame, theme: str) -> dict:
+    """Return the compiled Vega‑Lite spec for :func:`make_heatmap`.
+
+    Memoized on the (small) heatmap data and the colour theme so that
+    changing the selected year does not recompile the chart.
+    """
+    return make_heatmap(heatmap_df, theme).to_dict()
+
+
+def choropleth_figure(df_year: pd.DataFrame, theme: str) -> dict:
+    """Return the Plotly choropleth of complaints by state as a dict.
+
+    ``df_year`` holds one row per state with ``state_code`` and
+    ``complaints`` columns for a single year.  The figure is returned in
+    its JSON‑serialisable dict form, which ``st.plotly_chart`` accepts
+    directly.  Requires Plotly.
+    """
+    fig = px.choropleth(
+        df_year,
+        locations="state_code",
+        color="complaints",
+        locationmode="USA-states",
+        color_continuous_scale=theme,
+        range_color=(0, df_year["complaints"].max()),
+        scope="usa",
+        labels={"complaints": "Complaints"},
+    )
+    fig.update_layout(
+        template="plotly_dark",
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        margin=dict(l=0, r=0, t=0, b=0),
+        height=350,
     )
+    return fig.to_dict()
 
-    return plot_bg + plot_fg + text
 
+@st.cache_data
+def choropleth_figures(full_df: pd.DataFrame, theme: str) -> dict[int, dict]:
+    """Return the choropleth dict for every year, keyed by year.
+
+    Assembling a Plotly figure (validation and template composition) is
+    the expensive step and there are only four years, so all of them are
+    built together and memoized on the theme.  Switching the selected year
+    then becomes a dictionary lookup.  Requires Plotly.
+    """
+    return {
+        year: choropleth_figure(df_year, theme) for year, df_year in year_tables(full_df).items()
+    }
 
+
+@st.cache_data
 def load_dataset() -> pd.DataFrame:
-    """Load the cybercrime dataset from CSV or fall back to built‑in data.
+    """Load the cybercrime dataset from Parquet/CSV or fall back to built‑in data.
 
-    The CSV file ``cybercrime_top10.csv`` should reside in the same directory
-    as this script.  If the file is not found, this function uses a built‑in
+    The Parquet file ``cybercrime_top10.parquet`` is used when it is at least
+    as new as the CSV file ``cybercrime_top10.csv`` (or there is no CSV);
+    otherwise the CSV is read.  Both live in the same directory as this
+    script.  If neither can be loaded, this function uses a built‑in
     dataset derived from the Insurance Information Institute’s table of top
     states by number of cybercrime complaints and by losses for 2024【264901952604557†L84-L100】.
     Complaint counts for 2023–2021 are estimated via a 5 percent annual
     decrease from the 2024 figures.  Missing loss values are set to NaN.
     """
-    # Attempt to load the CSV from the same directory as this script
+    base_dir = os.path.dirname(__file__)
+    parquet_path = os.path.join(base_dir, "cybercrime_top10.parquet")
+    csv_path = os.path.join(base_dir, "cybercrime_top10.csv")
+    # Prefer the Parquet copy: it is columnar and typed, so there is no CSV
+    # tokenising or type inference and only the needed columns are read.
+    # A newer CSV wins, so a dropped‑in or edited file is never ignored.
+    try:
+        if not os.path.exists(csv_path) or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+            return pd.read_parquet(parquet_path, columns=list(_DATA_COLUMNS))
+    except Exception:
+        pass
+    # Otherwise attempt to load the CSV from the same directory as this script.
+    # PyArrow parses the memory‑mapped file straight into Arrow buffers and
+    # the frame is backed by them, avoiding a copy into NumPy/object arrays.
     try:
-        base_dir = os.path.dirname(__file__)
-        csv_path = os.path.join(base_dir, "cybercrime_top10.csv")
-        return pd.read_csv(csv_path)
+        convert_options = pa_csv.ConvertOptions(
+            column_types=_ARROW_TYPES, include_columns=list(_DATA_COLUMNS)
+        )
+        with pa.memory_map(csv_path) as source:
+            table = pa_csv.read_csv(source, convert_options=convert_options)
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
     except Exception:
         # Fallback dataset: list of states with 2024 complaints and losses
         states_data = [
@@ -150,26 +356,25 @@ def load_dataset() -> pd.DataFrame:
             ("North Carolina", "NC", 22021, np.nan),
             ("Arizona", "AZ", 20101, 392),
         ]
-        # Build records with 5 % annual decrease for prior years
-        records: list[dict[str, object]] = []
-        for state, code, complaints_2024, loss in states_data:
-            comp_2023 = int(round(complaints_2024 * 0.95))
-            comp_2022 = int(round(comp_2023 * 0.95))
-            comp_2021 = int(round(comp_2022 * 0.95))
-            records.append(
-                {
-                    "state": state,
-                    "state_code": code,
-                    "complaints_2024": complaints_2024,
-                    "complaints_2023": comp_2023,
-                    "complaints_2022": comp_2022,
-                    "complaints_2021": comp_2021,
-                    "losses_2024_million": loss,
-                }
-            )
-        return pd.DataFrame.from_records(records)
+        states, codes, complaints_2024, losses = zip(*states_data)
+        top_df = pd.DataFrame(
+            {
+                "state": states,
+                "state_code": codes,
+                "complaints_2024": complaints_2024,
+                "losses_2024_million": losses,
+            }
+        )
+        # Estimate prior years a whole column at a time with a 5 % annual
+        # decrease, rounding each year before the next is derived from it
+        complaints = top_df["complaints_2024"].to_numpy(dtype=np.float64)
+        for year in _YEARS[1:]:
+            complaints = np.round(complaints * 0.95)
+            top_df[f"complaints_{year}"] = complaints
+        return top_df[list(_DATA_COLUMNS)].astype(_DATA_DTYPES)
 
 
+@st.cache_data
 def build_full_data(top_df: pd.DataFrame) -> pd.DataFrame:
     """Return a DataFrame with every U.S. state and complaint counts.
 
@@ -181,106 +386,72 @@ def build_full_data(top_df: pd.DataFrame) -> pd.DataFrame:
         state, state_code, complaints_2024, complaints_2023,
         complaints_2022, complaints_2021, losses_2024_million
 
-    where complaint columns are integers and loss values may be NaN.
+    where ``state`` and ``state_code`` are categoricals, complaint columns
+    are integers and loss values may be NaN.  The result is NumPy‑backed
+    whichever backend ``top_df`` was loaded with.
     """
-    # List of all states and their postal abbreviations
-    us_states = [
-        {"name": "Alabama", "code": "AL"},
-        {"name": "Alaska", "code": "AK"},
-        {"name": "Arizona", "code": "AZ"},
-        {"name": "Arkansas", "code": "AR"},
-        {"name": "California", "code": "CA"},
-        {"name": "Colorado", "code": "CO"},
-        {"name": "Connecticut", "code": "CT"},
-        {"name": "Delaware", "code": "DE"},
-        {"name": "District of Columbia", "code": "DC"},
-        {"name": "Florida", "code": "FL"},
-        {"name": "Georgia", "code": "GA"},
-        {"name": "Hawaii", "code": "HI"},
-        {"name": "Idaho", "code": "ID"},
-        {"name": "Illinois", "code": "IL"},
-        {"name": "Indiana", "code": "IN"},
-        {"name": "Iowa", "code": "IA"},
-        {"name": "Kansas", "code": "KS"},
-        {"name": "Kentucky", "code": "KY"},
-        {"name": "Louisiana", "code": "LA"},
-        {"name": "Maine", "code": "ME"},
-        {"name": "Maryland", "code": "MD"},
-        {"name": "Massachusetts", "code": "MA"},
-        {"name": "Michigan", "code": "MI"},
-        {"name": "Minnesota", "code": "MN"},
-        {"name": "Mississippi", "code": "MS"},
-        {"name": "Missouri", "code": "MO"},
-        {"name": "Montana", "code": "MT"},
-        {"name": "Nebraska", "code": "NE"},
-        {"name": "Nevada", "code": "NV"},
-        {"name": "New Hampshire", "code": "NH"},
-        {"name": "New Jersey", "code": "NJ"},
-        {"name": "New Mexico", "code": "NM"},
-        {"name": "New York", "code": "NY"},
-        {"name": "North Carolina", "code": "NC"},
-        {"name": "North Dakota", "code": "ND"},
-        {"name": "Ohio", "code": "OH"},
-        {"name": "Oklahoma", "code": "OK"},
-        {"name": "Oregon", "code": "OR"},
-        {"name": "Pennsylvania", "code": "PA"},
-        {"name": "Rhode Island", "code": "RI"},
-        {"name": "South Carolina", "code": "SC"},
-        {"name": "South Dakota", "code": "SD"},
-        {"name": "Tennessee", "code": "TN"},
-        {"name": "Texas", "code": "TX"},
-        {"name": "Utah", "code": "UT"},
-        {"name": "Vermont", "code": "VT"},
-        {"name": "Virginia", "code": "VA"},
-        {"name": "Washington", "code": "WA"},
-        {"name": "West Virginia", "code": "WV"},
-        {"name": "Wisconsin", "code": "WI"},
-        {"name": "Wyoming", "code": "WY"},
-    ]
-
-    records: list[dict] = []
-    for item in us_states:
-        name = item["name"]
-        code = item["code"]
-        # Look up the row for this state in the top‑ten dataframe
-        row = top_df[top_df["state"] == name]
-        # Start building the record
-        record: dict[str, object] = {
-            "state": name,
-            "state_code": code,
-        }
-        # For each year assign the actual value or zero
-        for year in (2024, 2023, 2022, 2021):
-            col = f"complaints_{year}"
-            if not row.empty:
-                record[col] = int(row.iloc[0][col])
-            else:
-                record[col] = 0
-        # Set losses where available
-        if not row.empty:
-            record["losses_2024_million"] = row.iloc[0]["losses_2024_million"]
-        else:
-            record["losses_2024_million"] = np.nan
-        records.append(record)
-    return pd.DataFrame.from_records(records)
+    # Left‑join the top‑ten figures onto the full list of states in one pass
+    complaint_cols = list(_YEAR_MAP)
+    full_df = _US_STATES_DF.merge(
+        top_df[["state", *complaint_cols, "losses_2024_million"]], on="state", how="left"
+    )
+    # States outside the top ten have no complaints; losses stay NaN
+    full_df[complaint_cols] = full_df[complaint_cols].fillna(0).astype("int32")
+    full_df["losses_2024_million"] = full_df["losses_2024_million"].astype("float32")
+    # Names and codes repeat across every derived frame; store them as codes
+    full_df["state"] = full_df["state"].astype("category")
+    full_df["state_code"] = full_df["state_code"].astype("category")
+    return full_df
 
 
+@st.cache_data
 def prepare_heatmap_data(full_df: pd.DataFrame) -> pd.DataFrame:
     """Transform the wide DataFrame into long form for Altair heatmap.
 
     The input has complaint counts across multiple year columns.  This
-    function melts those columns into two columns: ``year`` and
-    ``complaints``.  The ``year`` column is converted to an integer for
-    proper sorting.
+    function stacks those columns into two columns: ``year`` and
+    ``complaints``, with one row per state and year.  The long form is
+    built directly from the underlying NumPy arrays; each column's year
+    comes from the precomputed ``_YEAR_MAP`` rather than per‑row string
+    parsing, and is stored as a small integer for proper sorting.
     """
-    # Select only complaint columns and state
-    complaint_cols = [c for c in full_df.columns if c.startswith("complaints_")]
-    melted = full_df.melt(
-        id_vars=["state"], value_vars=complaint_cols, var_name="year", value_name="complaints"
+    # Select only complaint columns and look up their years
+    complaint_cols = [c for c in full_df.columns if c in _YEAR_MAP]
+    years = np.array([_YEAR_MAP[c] for c in complaint_cols], dtype=np.int16)
+    # Row‑major reshape of the (state × year) matrix matches repeat/tile below
+    counts = full_df[complaint_cols].to_numpy()
+    # Repeat the underlying array so a categorical ``state`` stays categorical
+    states = full_df["state"].array
+    return pd.DataFrame(
+        {
+            "state": states.repeat(len(years)),
+            "year": np.tile(years, len(states)),
+            "complaints": counts.reshape(-1),
+        }
     )
-    # Extract the numeric year from the column name
-    melted["year"] = melted["year"].str.replace("complaints_", "").astype(int)
-    return melted
+
+
+@st.cache_data
+def year_tables(full_df: pd.DataFrame) -> dict[int, pd.DataFrame]:
+    """Return the per‑year state table for every year, keyed by year.
+
+    Each table has columns ``state``, ``state_code``, ``complaints`` and
+    ``losses_2024_million`` and is sorted by complaints in descending
+    order with a fresh index, which keeps the Arrow payload sent to
+    ``st.dataframe`` free of the shuffled index.  Missing loss values are
+    replaced with zero for a cleaner display.
+    """
+    tables: dict[int, pd.DataFrame] = {}
+    for year in _YEARS:
+        col_name = f"complaints_{year}"
+        # Column selection already yields a new frame, so no explicit copy is needed
+        df_year = full_df[["state", "state_code", col_name, "losses_2024_million"]].rename(
+            columns={col_name: "complaints"}
+        )
+        df_year = df_year.sort_values(by="complaints", ascending=False).reset_index(drop=True)
+        df_year["losses_2024_million"] = df_year["losses_2024_million"].fillna(0)
+        tables[year] = df_year
+    return tables
 
 
 def main() -> None:
@@ -302,7 +473,7 @@ def main() -> None:
     with st.sidebar:
         st.title("🛡️ US Cybercrime Dashboard")
         # Select year; list reversed so the most recent year appears first
-        years = [2024, 2023, 2022, 2021]
+        years = list(_YEARS)
         selected_year = st.selectbox("Select a year", years, index=0)
         # Colour themes for the choropleth
         color_theme_list = [
@@ -321,12 +492,10 @@ def main() -> None:
 
     # Prepare selected year's data
     col_name = f"complaints_{selected_year}"
-    df_selected_year = full_df[["state", "state_code", col_name, "losses_2024_million"]].copy()
-    df_selected_year = df_selected_year.rename(columns={col_name: "complaints"})
-    # Sort states by complaints descending
-    df_selected_year_sorted = df_selected_year.sort_values(by="complaints", ascending=False)
-    # Replace any missing loss values with zero for a cleaner display
-    df_selected_year_sorted["losses_2024_million"] = df_selected_year_sorted["losses_2024_million"].fillna(0)
+    # Tables for all years are precomputed; selecting one is a lookup
+    df_selected_year_sorted = year_tables(full_df)[selected_year]
+    # The largest count is simply the first row once sorted
+    max_complaints = int(df_selected_year_sorted["complaints"].iat[0])
 
     # Prepare heatmap data (once)
     heatmap_df = prepare_heatmap_data(full_df)
@@ -334,21 +503,27 @@ def main() -> None:
     # Compute year‑over‑year differences for metrics and migration percentages
     if selected_year > 2021:
         prev_col = f"complaints_{selected_year - 1}"
-        df_diff = full_df[["state", "state_code", col_name, prev_col]].copy()
-        df_diff["difference"] = df_diff[col_name] - df_diff[prev_col]
+        # Work on the raw arrays: one subtraction, then positional arg‑max/min
+        difference = full_df[col_name].to_numpy() - full_df[prev_col].to_numpy()
         # Determine top positive and negative changes
-        top_gain = df_diff.loc[df_diff["difference"].idxmax()]
-        top_loss = df_diff.loc[df_diff["difference"].idxmin()]
+        gain_pos = int(difference.argmax())
+        loss_pos = int(difference.argmin())
+        top_gain = full_df.iloc[gain_pos]
+        top_loss = full_df.iloc[loss_pos]
+        gain_difference = difference[gain_pos]
+        loss_difference = difference[loss_pos]
         # Calculate the proportion of states with significant migration
-        inbound_states = (df_diff["difference"] > 5000).sum()
-        outbound_states = (df_diff["difference"] < -5000).sum()
-        total_states = len(df_diff)
+        inbound_states = int((difference > 5000).sum())
+        outbound_states = int((difference < -5000).sum())
+        total_states = len(difference)
         inbound_percent = inbound_states / total_states * 100
         outbound_percent = outbound_states / total_states * 100
     else:
         # First year has no previous year for comparison
         top_gain = None
         top_loss = None
+        gain_difference = None
+        loss_difference = None
         inbound_percent = 0
         outbound_percent = 0
 
@@ -362,13 +537,13 @@ def main() -> None:
             # Display the state with the largest increase
             gain_state = top_gain["state"]
             gain_value = format_number(top_gain[col_name])
-            gain_delta = format_number(top_gain["difference"])
+            gain_delta = format_number(gain_difference)
             st.metric(label=gain_state, value=gain_value, delta=f"+{gain_delta}")
 
             # Display the state with the largest decrease
             loss_state = top_loss["state"]
             loss_value = format_number(top_loss[col_name])
-            loss_delta = format_number(top_loss["difference"])
+            loss_delta = format_number(loss_difference)
             st.metric(label=loss_state, value=loss_value, delta=loss_delta)
         else:
             # For 2021 (no previous year) display placeholder metrics
@@ -386,32 +561,16 @@ def main() -> None:
         mig_cols = st.columns((0.2, 1, 0.2))
         with mig_cols[1]:
             st.write("Inbound")
-            st.altair_chart(donut_inbound, use_container_width=True)
+            st.vega_lite_chart(spec=donut_inbound, use_container_width=True)
             st.write("Outbound")
-            st.altair_chart(donut_outbound, use_container_width=True)
+            st.vega_lite_chart(spec=donut_outbound, use_container_width=True)
 
     # Column 2: Choropleth and heatmap
     with col[1]:
         st.markdown("#### Total Complaints by State")
         # Choropleth (Plotly if available; otherwise a bar chart fallback)
         if PLOTLY_AVAILABLE:
-            fig = px.choropleth(
-                df_selected_year,
-                locations="state_code",
-                color="complaints",
-                locationmode="USA-states",
-                color_continuous_scale=selected_theme,
-                range_color=(0, df_selected_year["complaints"].max()),
-                scope="usa",
-                labels={"complaints": "Complaints"},
-            )
-            fig.update_layout(
-                template="plotly_dark",
-                plot_bgcolor="rgba(0,0,0,0)",
-                paper_bgcolor="rgba(0,0,0,0)",
-                margin=dict(l=0, r=0, t=0, b=0),
-                height=350,
-            )
+            fig = choropleth_figures(full_df, selected_theme)[selected_year]
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.warning(
@@ -420,49 +579,21 @@ def main() -> None:
             )
             # Simple fallback: top N states bar chart for the selected year
             topn = df_selected_year_sorted.head(15)
+            topn = topn.assign(complaints_label=format_number_array(topn["complaints"]))
             bar = (
                 alt.Chart(topn)
                 .mark_bar()
                 .encode(
                     x=alt.X("complaints:Q", title="Complaints"),
                     y=alt.Y("state:N", sort="-x", title="State"),
-                    tooltip=["state", "complaints"],
+                    tooltip=["state", alt.Tooltip("complaints_label:N", title="Complaints")],
                 )
                 .properties(height=350)
             )
             st.altair_chart(bar, use_container_width=True)
 
         # Heatmap showing complaints over years and states
-        heatmap = (
-            alt.Chart(heatmap_df)
-            .mark_rect()
-            .encode(
-                y=alt.Y(
-                    "year:O",
-                    axis=alt.Axis(
-                        title="Year",
-                        titleFontSize=16,
-                        titleFontWeight=600,
-                        labelAngle=0,
-                    ),
-                ),
-                x=alt.X(
-                    "state:O",
-                    sort=alt.EncodingSortField(field="complaints", op="sum", order="descending"),
-                    axis=alt.Axis(title="State", titleFontSize=16, titleFontWeight=600),
-                ),
-                color=alt.Color(
-                    "complaints:Q",
-                    scale=alt.Scale(scheme=selected_theme),
-                    legend=alt.Legend(title="Complaints"),
-                ),
-                stroke=alt.value("black"),
-                strokeWidth=alt.value(0.25),
-            )
-            .properties(width=900, height=300)
-            .configure_axis(labelFontSize=10, titleFontSize=12)
-        )
-        st.altair_chart(heatmap, use_container_width=True)
+        st.vega_lite_chart(spec=heatmap_spec(heatmap_df, selected_theme), use_container_width=True)
 
     # Column 3: Data table and description
     with col[2]:
@@ -478,7 +609,7 @@ def main() -> None:
                     "Complaints",
                     format="{:,.0f}",
                     min_value=0,
-                    max_value=int(df_selected_year_sorted["complaints"].max()),
+                    max_value=max_complaints,
                 ),
                 "losses_2024_million": st.column_config.NumberColumn(
                     "Losses 2024 (USD m)",
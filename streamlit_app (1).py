@@ -1,16 +1,196 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-from typing import Tuple
+import plotly.graph_objects as go
+from plotly.colors import qualitative
+from typing import List, Optional, Tuple
+from itertools import chain
+from dataclasses import dataclass
+from operator import attrgetter
 import os
 
+# String columns stored as categoricals: a handful of distinct values repeated
+# over every row, so filters and groupbys work on small integer codes
+CATEGORY_COLUMNS = ["gender", "occupation", "genres", "title"]
 
-@st.cache_data
-def load_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
+# Columns used by the dashboard ("genre" in pre-cleaned files; user_id and
+# movie_id only to identify ratings); the remaining CSV columns are never loaded
+DATA_COLUMNS = ["user_id", "movie_id", "age", "gender", "occupation", "title", "year", "genres", "genre", "rating"]
+
+# Narrow storage types for the numeric columns. Integer targets are only used
+# when every value is present, integral and in range; otherwise the column is
+# stored as float32 ("year" has missing values, so it is float32 outright)
+NUMERIC_DTYPES = {"age": np.int8, "rating": np.int8, "year": np.float32}
+
+
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert the columns in NUMERIC_DTYPES to their narrow dtypes in place.
+    Values are checked against the integer range first, so nothing is
+    silently truncated or wrapped around.
+    """
+    for column, dtype in NUMERIC_DTYPES.items():
+        values = df[column]
+        if np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            fits = (
+                values.notna().all()
+                and values.between(info.min, info.max).all()
+                and (values % 1 == 0).all()
+            )
+            if not fits:
+                dtype = np.float32
+        df[column] = values.astype(dtype)
+    return df
+
+
+def read_exploded_csv(csv_path: str) -> pd.DataFrame:
+    """
+    Parse the ratings CSV and explode it by genre (one row per rating and genre),
+    with the string columns in CATEGORY_COLUMNS converted to categoricals and
+    the numeric ones narrowed per NUMERIC_DTYPES.
+    This is the expensive step that the Parquet cache avoids on later starts.
+
+    A ``rating_id`` column identifies the rating each row belongs to; rows are
+    ordered by it and each (rating, genre) pair appears once.
+    """
+    # The multithreaded pyarrow parser needs the columns listed up front
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = [column for column in header if column in DATA_COLUMNS]
+    df = downcast_numeric(pd.read_csv(csv_path, usecols=usecols, engine="pyarrow"))
+
+    # Some files already repeat each rating once per genre, so where user and
+    # movie are known they identify the rating rather than the CSV line
+    if "user_id" in df.columns and "movie_id" in df.columns:
+        rating_ids = df.groupby(["user_id", "movie_id"], sort=False, dropna=False).ngroup().to_numpy()
+        df = df.drop(columns=["user_id", "movie_id"])
+    else:
+        rating_ids = np.arange(len(df))
+
+    # Ensure genres column is properly exploded
+    if "genres" in df.columns:
+        # Split once, repeat the other columns by the genre count per row and
+        # lay the genres out flat, rather than an object-dtype explode
+        genres = df["genres"]
+        splits = genres.fillna("").str.split("|").to_numpy()
+        lengths = np.fromiter(map(len, splits), dtype=np.intp, count=len(splits))
+        row_idx = np.repeat(np.arange(len(df)), lengths)
+        flat_genres = pd.Categorical(list(chain.from_iterable(splits)))
+        flat_genres[np.repeat(genres.isna().to_numpy(), lengths)] = np.nan
+        df_exp = df.drop(columns="genres").take(row_idx)
+        df_exp.insert(df.columns.get_loc("genres"), "genres", flat_genres)
+    elif "genre" in df.columns:  # in case pre-cleaned version has single genre
+        row_idx = np.arange(len(df))
+        df_exp = df.rename(columns={"genre": "genres"})
+    else:
+        raise ValueError("No genre column found in dataset.")
+
+    df_exp = df_exp.assign(rating_id=rating_ids[row_idx].astype(np.int32))
+    df_exp = df_exp.sort_values("rating_id", kind="stable").drop_duplicates(["rating_id", "genres"], ignore_index=True)
+    df_exp[CATEGORY_COLUMNS] = df_exp[CATEGORY_COLUMNS].astype("category")
+    return df_exp
+
+
+def materialize_parquet(df_exp: pd.DataFrame, parquet_path: str) -> None:
+    """
+    Write the exploded frame from read_exploded_csv to a zstd-compressed
+    Parquet file.
+    The file is written under a temporary name and then moved into place,
+    so a concurrent reader never sees a partial file; a failed write removes
+    the temporary file again.
+    """
+    tmp_path = parquet_path + ".tmp"
+    try:
+        df_exp.to_parquet(tmp_path, compression="zstd", index=False)
+        os.replace(tmp_path, parquet_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+@dataclass(frozen=True)
+class Ratings:
+    """
+    The dataset as one row per rating, with genre membership kept apart in
+    CSR form: the genres of ``rows.iloc[i]`` are
+    ``genres.iloc[genre_offsets[i]:genre_offsets[i + 1]]``.
+
+    Filters and per-rating aggregates run over the ratings once each, rather
+    than once per genre as on the exploded frame.
+
+    ``age_order`` sorts the rows by age and ``sorted_ages`` holds the ages in
+    that order, so the rows in an age range are one contiguous slice of
+    ``age_order`` found by binary search.
+
+    ``version`` is the (CSV path, source mtime) the data was loaded from and
+    stands in for the data in cache keys. The index arrays are read-only, as
+    one instance is shared by every session.
+    """
+    version: Tuple[str, float]
+    rows: pd.DataFrame
+    genres: pd.Series
+    genre_offsets: np.ndarray
+    age_order: np.ndarray
+    sorted_ages: np.ndarray
+
+
+def split_genres(df_exp: pd.DataFrame, version: Tuple[str, float]) -> Ratings:
+    """
+    Build Ratings from the exploded frame written by read_exploded_csv, whose
+    rows are grouped by ``rating_id``.
+    """
+    rating_ids = df_exp["rating_id"].to_numpy()
+    starts = np.flatnonzero(np.diff(rating_ids, prepend=-1))
+    rows = df_exp.drop(columns=["genres", "rating_id"]).iloc[starts].reset_index(drop=True)
+    ages = rows["age"].to_numpy()
+    age_order = np.argsort(ages, kind="stable")
+    genre_offsets = np.append(starts, len(df_exp))
+    sorted_ages = ages[age_order]
+    for array in (genre_offsets, age_order, sorted_ages):
+        array.flags.writeable = False
+    return Ratings(
+        version=version,
+        rows=rows,
+        genres=df_exp["genres"].reset_index(drop=True),
+        genre_offsets=genre_offsets,
+        age_order=age_order,
+        sorted_ages=sorted_ages,
+    )
+
+
+# Cache keys for Ratings: the source it was loaded from, not its contents
+RATINGS_HASH_FUNCS = {Ratings: attrgetter("version")}
+
+
+@st.cache_resource(max_entries=1)
+def load_ratings(csv_path: str, source_mtime: float) -> Ratings:
+    """
+    Load ``csv_path`` as Ratings, shared by all sessions. Keyed by the source
+    mtime, so an edited CSV or script is picked up on the next rerun and the
+    previous copy is released.
+
+    The exploded frame is cached next to the CSV as ``<name>.exploded.parquet``
+    and memory-mapped on load; it is rebuilt whenever the CSV or this script
+    is newer than the cache.
+    """
+    version = (csv_path, source_mtime)
+    parquet_path = os.path.splitext(csv_path)[0] + ".exploded.parquet"
+    if not os.path.exists(parquet_path) or os.path.getmtime(parquet_path) < source_mtime:
+        df_exp = read_exploded_csv(csv_path)
+        try:
+            materialize_parquet(df_exp, parquet_path)
+        except OSError:
+            # Read-only deployment: use the frame parsed above directly
+            return split_genres(df_exp, version)
+
+    return split_genres(pd.read_parquet(parquet_path, memory_map=True), version)
+
+
+def load_data() -> Ratings:
     """
     Load dataset. Prefers movie_ratings.csv, falls back to movie_ratings_EC.csv.
-    Returns original dataframe and exploded (by genre).
+    Returns the ratings and their genres, shared by all sessions.
     """
     if os.path.exists("movie_ratings.csv"):
         csv_path = "movie_ratings.csv"
@@ -21,17 +201,312 @@ def load_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
             "No dataset file found. Expected 'movie_ratings.csv' or 'movie_ratings_EC.csv' in the current directory."
         )
 
-    df = pd.read_csv(csv_path)
+    source_mtime = max(os.path.getmtime(csv_path), os.path.getmtime(__file__))
+    return load_ratings(csv_path, source_mtime)
 
-    # Ensure genres column is properly exploded
-    if "genres" in df.columns:
-        df_exp = df.assign(genres=df["genres"].str.split("|")).explode("genres")
-    elif "genre" in df.columns:  # in case pre-cleaned version has single genre
-        df_exp = df.rename(columns={"genre": "genres"})
-    else:
-        raise ValueError("No genre column found in dataset.")
 
-    return df, df_exp
+def category_codes(column: pd.Series, selected: List[str]) -> Tuple[int, ...]:
+    """
+    Sorted category codes of the selected values of a categorical column.
+    This is the canonical form of a multiselect used as a cache key: it does
+    not depend on the order in which the values were picked.
+    """
+    return tuple(np.flatnonzero(column.cat.categories.isin(selected)).tolist())
+
+
+def category_selection(column: pd.Series, codes: Tuple[int, ...]) -> np.ndarray:
+    """
+    Boolean array over the categories of ``column``, True at ``codes``.
+    """
+    selected = np.zeros(len(column.cat.categories), dtype=bool)
+    selected[list(codes)] = True
+    return selected
+
+
+def category_mask(column: pd.Series, codes: Tuple[int, ...], positions: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Boolean row mask for the category ``codes`` of a categorical column,
+    over all rows or only those at ``positions``.
+    Builds a lookup table over the (few) categories and indexes it with the
+    row codes; the trailing False entry is what missing values (code -1) hit.
+    """
+    lut = np.append(category_selection(column, codes), False)
+    row_codes = column.cat.codes.to_numpy()
+    return lut[row_codes if positions is None else row_codes[positions]]
+
+
+def filter_rows(
+    data: Ratings,
+    age_range: Tuple[int, int],
+    genders: Tuple[int, ...],
+    occupations: Tuple[int, ...],
+    genres: Tuple[int, ...],
+) -> np.ndarray:
+    """
+    Apply the sidebar filters (categories given as codes) to the ratings.
+    Returns the positions of the matching rows, in age order; a rating
+    matches the genre filter if any of its genres is selected.
+
+    The age range is looked up in the age-sorted index rather than scanned,
+    and the other predicates are combined in place into a single boolean
+    array over just those candidate rows.
+    """
+    rows = data.rows
+    lo = np.searchsorted(data.sorted_ages, age_range[0], side="left")
+    hi = np.searchsorted(data.sorted_ages, age_range[1], side="right")
+    candidates = data.age_order[lo:hi]
+    mask = category_mask(rows["gender"], genders, candidates)
+    mask &= category_mask(rows["occupation"], occupations, candidates)
+    # Selected genres per rating, as differences of a running count at the offsets
+    hits = np.concatenate(([0], np.cumsum(category_mask(data.genres, genres))))
+    offsets = data.genre_offsets
+    mask &= hits[offsets[candidates + 1]] > hits[offsets[candidates]]
+    return candidates[mask]
+
+
+def mean_table(name: str, categories: pd.Index, sums: np.ndarray, counts: np.ndarray) -> pd.DataFrame:
+    """
+    Mean and count per category from per-category sums and counts.
+    Only categories with at least one value are returned, in category order.
+    """
+    observed = counts > 0
+    return pd.DataFrame({
+        name: categories[observed],
+        "mean": sums[observed] / counts[observed],
+        "count": counts[observed],
+    })
+
+
+def group_mean(keys: pd.Series, values: np.ndarray, rows: np.ndarray) -> pd.DataFrame:
+    """
+    Mean and count of ``values`` for each category of the categorical ``keys``,
+    over the given row positions.
+    Sums and counts come from np.bincount over the category codes rather than
+    a pandas groupby.
+    """
+    codes = keys.cat.codes.to_numpy()[rows]
+    n_groups = len(keys.cat.categories)
+    counts = np.bincount(codes, minlength=n_groups)
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    return mean_table(keys.name, keys.cat.categories, sums, counts)
+
+
+@st.cache_resource(hash_funcs=RATINGS_HASH_FUNCS, max_entries=1)
+def rating_cube(data: Ratings) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Rating sums and counts for every (gender, occupation, age, genre) cell.
+    Returns ``(sums, counts, min_age)``; the arrays are indexed by the category
+    codes of gender, occupation and genre and by ``age - min_age``.
+
+    The cube holds a few tens of thousands of cells, so the genre sections can
+    be answered by reducing it rather than the rows. Built once and shared.
+    """
+    # One entry per (rating, genre) pair
+    rows = data.rows
+    lengths = np.diff(data.genre_offsets)
+    ages = np.repeat(rows["age"].to_numpy(), lengths)
+    codes = [np.repeat(rows[column].cat.codes.to_numpy(), lengths) for column in ("gender", "occupation")]
+    codes.append(data.genres.cat.codes.to_numpy())
+    valid = ~np.isnan(ages)
+    for column_codes in codes:
+        valid &= column_codes >= 0
+
+    min_age = int(np.nanmin(ages))
+    shape = (
+        len(rows["gender"].cat.categories),
+        len(rows["occupation"].cat.categories),
+        int(np.nanmax(ages)) - min_age + 1,
+        len(data.genres.cat.categories),
+    )
+    cells = np.ravel_multi_index(
+        (codes[0][valid], codes[1][valid], ages[valid].astype(np.intp) - min_age, codes[2][valid]), shape
+    )
+    size = int(np.prod(shape))
+    ratings = np.repeat(rows["rating"].to_numpy(dtype=np.float64), lengths)[valid]
+    counts = np.bincount(cells, minlength=size).reshape(shape)
+    sums = np.bincount(cells, weights=ratings, minlength=size).reshape(shape)
+    counts.flags.writeable = sums.flags.writeable = False
+    return sums, counts, min_age
+
+
+def genre_summary(
+    data: Ratings,
+    age_range: Tuple[int, int],
+    genders: Tuple[int, ...],
+    occupations: Tuple[int, ...],
+    genres: Tuple[int, ...],
+) -> pd.DataFrame:
+    """
+    Mean rating and count per genre for the sidebar selection, read off the
+    rating cube: the selected genders, occupations and ages are summed out
+    and the unselected genres dropped.
+    """
+    sums, counts, min_age = rating_cube(data)
+    cell_index = np.ix_(
+        category_selection(data.rows["gender"], genders),
+        category_selection(data.rows["occupation"], occupations),
+        np.arange(max(age_range[0] - min_age, 0), max(age_range[1] - min_age + 1, 0)),
+    )
+    genre_selected = category_selection(data.genres, genres)
+    genre_sums = sums[cell_index].sum(axis=(0, 1, 2)) * genre_selected
+    genre_counts = counts[cell_index].sum(axis=(0, 1, 2)) * genre_selected
+    return mean_table("genres", data.genres.cat.categories, genre_sums, genre_counts)
+
+
+def year_mean(years: np.ndarray, ratings: np.ndarray) -> pd.DataFrame:
+    """
+    Mean rating per release year, like ``groupby("year").mean()`` with missing
+    years dropped. Years span a small dense range, so sums and counts are
+    accumulated with np.bincount on the offset from the earliest year.
+    """
+    present = ~np.isnan(years)
+    years, ratings = years[present], ratings[present]
+    first_year = years.min() if years.size else 0
+    offsets = (years - first_year).astype(np.intp)
+    counts = np.bincount(offsets)
+    sums = np.bincount(offsets, weights=ratings)
+    observed = np.flatnonzero(counts)
+    return pd.DataFrame({
+        "year": (first_year + observed).astype(years.dtype),
+        "rating": sums[observed] / counts[observed],
+    })
+
+
+def observed_categories(column: pd.Series) -> List[str]:
+    """
+    Categories of a categorical column that occur at least once, in category
+    order. Counted with np.bincount over the codes instead of hashing every
+    value as ``unique()`` does.
+    """
+    codes = column.cat.codes.to_numpy()
+    present = np.bincount(codes[codes >= 0], minlength=len(column.cat.categories)) > 0
+    return column.cat.categories[present].tolist()
+
+
+@st.cache_data(hash_funcs=RATINGS_HASH_FUNCS)
+def filter_options(data: Ratings) -> Tuple[Tuple[int, int], List[str], List[str], List[str]]:
+    """
+    Sidebar choices: the age bounds and the genders, occupations and genres
+    present in the data. They never change for a loaded dataset, so they are
+    computed once instead of scanning the columns on every rerun.
+    """
+    ages = data.rows["age"]
+    return (
+        (int(ages.min()), int(ages.max())),
+        observed_categories(data.rows["gender"]),
+        observed_categories(data.rows["occupation"]),
+        observed_categories(data.genres),
+    )
+
+
+def top_rated(movie_stats: pd.DataFrame, min_ratings: int, n: int = 5) -> pd.DataFrame:
+    """
+    The ``n`` movies with the highest mean rating among those with at least
+    ``min_ratings`` ratings, best first; equal means keep title order, also
+    when deciding which tied titles make the cut.
+    The ``n``-th best mean is found with np.partition; only the titles at or
+    above it (the winners plus any ties at the cutoff) are then sorted.
+
+    >>> ties = pd.DataFrame({"title": [f"t{i:02d}" for i in range(30)], "mean_rating": 4.0, "count": 60})
+    >>> top_rated(ties, 50)["title"].tolist()
+    ['t00', 't01', 't02', 't03', 't04']
+    >>> ties.loc[[1, 27], "mean_rating"] = 4.5
+    >>> ties.loc[0, "count"] = 10
+    >>> top_rated(ties, 50, n=4)["title"].tolist()
+    ['t01', 't27', 't02', 't03']
+    """
+    eligible = movie_stats["count"].to_numpy() >= min_ratings
+    means = np.where(eligible, movie_stats["mean_rating"].to_numpy(), -np.inf)
+    n = min(n, int(eligible.sum()))
+    if n == 0:
+        return movie_stats.iloc[:0]
+    cutoff = np.partition(means, -n)[-n]
+    candidates = np.flatnonzero(means >= cutoff)
+    top = candidates[np.lexsort((candidates, -means[candidates]))[:n]]
+    return movie_stats.iloc[top]
+
+
+@st.cache_data(hash_funcs=RATINGS_HASH_FUNCS, max_entries=64)
+def summarize(
+    data: Ratings,
+    age_range: Tuple[int, int],
+    genders: Tuple[int, ...],
+    occupations: Tuple[int, ...],
+    genres: Tuple[int, ...],
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Filter the data and compute the tables behind the four dashboard sections:
+    genre counts, mean rating per genre, mean rating per year and per-movie stats.
+
+    Cached on the filter selection, passed as sorted category codes (see
+    category_codes) so the same selection always hits the same entry; the 64
+    most recent selections are kept. The shared data from load_data is keyed
+    by its version rather than hashed. Changing only the minimum-ratings threshold
+    reuses these results and just re-slices the movie stats.
+
+    The per-year and per-movie aggregates read only the columns they need at
+    the matching row positions; no filtered copy of the frame is built.
+    """
+    rows = filter_rows(data, age_range, genders, occupations, genres)
+    # Gather first, then widen: only the matching ratings are converted
+    ratings = data.rows["rating"].to_numpy()[rows].astype(np.float64)
+
+    # Sections 1 and 2 come from the precomputed cube, not the rows
+    genre_stats = genre_summary(data, age_range, genders, occupations, genres)
+    genre_counts = pd.DataFrame({"Genre": genre_stats["genres"], "Count": genre_stats["count"]}).sort_values(
+        "Count", ascending=False, kind="stable", ignore_index=True
+    )
+    genre_ratings = genre_stats.rename(columns={"mean": "rating"})
+
+    ratings_by_year = year_mean(data.rows["year"].to_numpy()[rows], ratings)
+    movie_stats = group_mean(data.rows["title"], ratings, rows).rename(columns={"mean": "mean_rating"})
+    return genre_counts, genre_ratings, ratings_by_year, movie_stats
+
+
+# The charts are built with graph_objects from the small aggregate tables;
+# plotly.express would re-derive traces, colours and labels from a DataFrame
+# on every rerun. A fresh figure is built each time rather than updating a
+# cached one in place, since sessions render concurrently.
+
+def genre_count_figure(genre_counts: pd.DataFrame) -> go.Figure:
+    """
+    Section 1: one bar, colour and legend entry per genre.
+    """
+    palette = qualitative.Plotly
+    fig = go.Figure([
+        go.Bar(x=[genre], y=[count], name=genre, legendgroup=genre, marker_color=palette[i % len(palette)],
+               hovertemplate="Genre=%{x}<br>Count=%{y}<extra></extra>")
+        for i, (genre, count) in enumerate(zip(genre_counts["Genre"], genre_counts["Count"]))
+    ])
+    fig.update_layout(title="Genre Breakdown (Filtered)", xaxis_title="Genre", yaxis_title="Count",
+                      legend_title="Genre", barmode="relative")
+    return fig
+
+
+def genre_rating_figure(genre_ratings: pd.DataFrame) -> go.Figure:
+    """
+    Section 2: mean rating per genre, coloured on a continuous blue scale.
+    """
+    fig = go.Figure(go.Bar(
+        x=genre_ratings["genres"], y=genre_ratings["rating"],
+        marker=dict(color=genre_ratings["rating"], coloraxis="coloraxis"),
+        hovertemplate="genres=%{x}<br>rating=%{y}<extra></extra>",
+    ))
+    fig.update_layout(title="Average Rating by Genre", xaxis_title="genres", yaxis_title="rating",
+                      coloraxis=dict(colorscale="Blues", colorbar_title="rating"), barmode="relative")
+    return fig
+
+
+def year_trend_figure(ratings_by_year: pd.DataFrame) -> go.Figure:
+    """
+    Section 3: mean rating per release year as a line.
+    """
+    fig = go.Figure(go.Scatter(
+        x=ratings_by_year["year"], y=ratings_by_year["rating"], mode="lines",
+        hovertemplate="year=%{x}<br>rating=%{y}<extra></extra>",
+    ))
+    fig.update_layout(title="Mean Rating Across Release Years", xaxis_title="year", yaxis_title="rating")
+    return fig
 
 
 def main():
@@ -39,51 +514,41 @@ def main():
     st.markdown("Analyze Movie ratings dataset interactively.")
 
     # Load dataset
-    df, df_exp = load_data()
+    data = load_data()
 
     # Sidebar filters
     st.sidebar.header("Filters")
-    age_range = st.sidebar.slider("Age Range", int(df["age"].min()), int(df["age"].max()), (18, 50))
-    genders = st.sidebar.multiselect("Gender", df["gender"].unique(), default=list(df["gender"].unique()))
-    occupations = st.sidebar.multiselect("Occupation", df["occupation"].unique(), default=list(df["occupation"].unique()))
-    selected_genres = st.sidebar.multiselect("Genres", df_exp["genres"].unique(), default=list(df_exp["genres"].unique()))
-
-    # Filtered dataset
-    filtered = df_exp[
-        (df_exp["age"].between(age_range[0], age_range[1]))
-        & (df_exp["gender"].isin(genders))
-        & (df_exp["occupation"].isin(occupations))
-        & (df_exp["genres"].isin(selected_genres))
-    ]
+    (min_age, max_age), gender_options, occupation_options, genre_options = filter_options(data)
+    age_range = st.sidebar.slider("Age Range", min_age, max_age, (18, 50))
+    genders = st.sidebar.multiselect("Gender", gender_options, default=gender_options)
+    occupations = st.sidebar.multiselect("Occupation", occupation_options, default=occupation_options)
+    selected_genres = st.sidebar.multiselect("Genres", genre_options, default=genre_options)
+
+    # Aggregates for the filtered dataset
+    genre_counts, genre_ratings, ratings_by_year, movie_stats = summarize(
+        data,
+        age_range,
+        category_codes(data.rows["gender"], genders),
+        category_codes(data.rows["occupation"], occupations),
+        category_codes(data.genres, selected_genres),
+    )
 
     st.subheader("1. Breakdown of Genres")
-    genre_counts = filtered["genres"].value_counts().reset_index()
-    genre_counts.columns = ["Genre", "Count"]
-    fig1 = px.bar(genre_counts, x="Genre", y="Count", title="Genre Breakdown (Filtered)", color="Genre")
+    fig1 = genre_count_figure(genre_counts)
     st.plotly_chart(fig1, use_container_width=True)
 
     st.subheader("2. Genres with Highest Viewer Satisfaction")
-    genre_ratings = filtered.groupby("genres")["rating"].mean().reset_index()
-    fig2 = px.bar(genre_ratings.sort_values("rating", ascending=False), x="genres", y="rating",
-                  title="Average Rating by Genre", color="rating", color_continuous_scale="Blues")
+    fig2 = genre_rating_figure(genre_ratings.sort_values("rating", ascending=False))
     st.plotly_chart(fig2, use_container_width=True)
 
     st.subheader("3. Mean Rating by Movie Release Year")
-    ratings_by_year = filtered.groupby("year")["rating"].mean().reset_index()
-    fig3 = px.line(ratings_by_year, x="year", y="rating", title="Mean Rating Across Release Years")
+    fig3 = year_trend_figure(ratings_by_year)
     st.plotly_chart(fig3, use_container_width=True)
 
     st.subheader("4. Top Rated Movies")
     min_ratings = st.sidebar.slider("Minimum Ratings Threshold", 50, 500, 50, step=50)
 
-    movie_stats = filtered.groupby("title").agg(
-        mean_rating=("rating", "mean"),
-        count=("rating", "count")
-    ).reset_index()
-
-    top_movies = movie_stats[movie_stats["count"] >= min_ratings].sort_values(
-        by="mean_rating", ascending=False
-    ).head(5)
+    top_movies = top_rated(movie_stats, min_ratings)
 
     st.write(f"Top 5 Movies with at least {min_ratings} ratings:")
     st.table(top_movies)